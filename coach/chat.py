@@ -6,6 +6,10 @@ Unlike heartbeat, coach doesn't track viewers - it just watches
 chat flow to find good moments for reminders.
 """
 
+import asyncio
+import collections
+import logging
+import sys
 from datetime import datetime
 from twitchio.ext import commands
 from colorama import Fore, Style
@@ -13,6 +17,17 @@ from colorama import Fore, Style
 from coach.engine import CoachEngine
 from coach.context import ContextEngine
 
+logger = logging.getLogger(__name__)
+
+# Pre-rendered console tags - the ANSI wrapping never changes, so
+# building it per print is wasted work
+_COACH_TAG = f"{Fore.CYAN}[Coach]{Style.RESET_ALL}"
+_ERR_TAG = f"{Fore.RED}[Error]{Style.RESET_ALL}"
+
+# Max seconds buffered messages wait before being processed; floods
+# accumulating within this window drain as one batch
+FLUSH_INTERVAL_SECONDS = 0.05
+
 
 class CoachBot(commands.Bot):
     """
@@ -53,46 +68,86 @@ class CoachBot(commands.Bot):
         self.config = config
         self.engine = engine
         self.context = context
-        self.show_chat = config.get("logging", {}).get("show_chat", False)
+        self.show_chat = config["logging"]["show_chat"]
+
+        # Incoming messages are buffered here and drained in batches so
+        # a chat flood coalesces into one context update per flush
+        self._inbox: collections.deque = collections.deque()
+        self._inbox_event = asyncio.Event()
     
     async def event_ready(self):
         """Called when the bot successfully connects to Twitch."""
         print(f"{Fore.GREEN}[Coach] Connected to #{self.channel_name}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}[Coach]{Style.RESET_ALL} Monitoring context... (Ctrl+C to stop)")
+        print(f"{_COACH_TAG} Monitoring context... (Ctrl+C to stop)")
         print()
         
-        # Start the coach engine's timer monitoring
+        # Start the coach engine's timer monitoring and the inbox drain
         self.loop.create_task(self.engine.start_monitoring())
-    
+        self.loop.create_task(self._drain_inbox())
+
     async def event_message(self, message):
         """
         Called for every chat message.
-        
-        Forwards to context engine for activity tracking.
+
+        Buffers the message for the batch drain; per-message work is
+        kept to a minimum since this is the hottest path in the program.
         """
         if message.echo:
             return
-        
+
         author = message.author.name if message.author else "unknown"
-        content = message.content
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        # Log to console if enabled
-        if self.show_chat:
-            print(f"{Fore.WHITE}[{timestamp}]{Style.RESET_ALL} {Fore.YELLOW}{author}{Style.RESET_ALL}: {content}")
-        
-        # Check if this is the streamer
-        is_streamer = author.lower() == self.channel_name.lower()
-        
-        # Forward to context engine
-        self.context.on_message(
-            username=author,
-            content=content,
-            is_streamer=is_streamer
-        )
+
+        # Check if this is the streamer. Chatter.name is the IRC login,
+        # which Twitch guarantees lowercase, and channel_name is stored
+        # lowercased in __init__, so no per-message .lower() is needed
+        is_streamer = author == self.channel_name
+
+        self._inbox.append((author, message.content, is_streamer))
+        self._inbox_event.set()
+
+    async def _drain_inbox(self):
+        """
+        Background task: drain buffered messages in coalesced batches.
+
+        Waits for the first message, lets a short flush window pass so a
+        flood accumulates, then hands the whole batch to the context
+        engine in one call.
+        """
+        while True:
+            await self._inbox_event.wait()
+            self._inbox_event.clear()
+
+            # Let a flood accumulate before draining
+            await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+
+            if not self._inbox:
+                continue
+
+            batch = []
+            while self._inbox:
+                batch.append(self._inbox.popleft())
+
+            # A bad batch must not kill the drain task - log the error
+            # and keep processing subsequent batches
+            try:
+                # Log to console if enabled (timestamp only formatted when
+                # shown). The batch is written in one call so the stdio lock
+                # is taken once per flush instead of once per message.
+                if self.show_chat:
+                    ts_tag = f"{Fore.WHITE}[{datetime.now().strftime('%H:%M:%S')}]{Style.RESET_ALL}"
+                    sys.stdout.write("".join(
+                        f"{ts_tag} {Fore.YELLOW}{author}{Style.RESET_ALL}: {content}\n"
+                        for author, content, _ in batch
+                    ))
+
+                # Forward the whole batch to the context engine
+                self.context.on_message_batch(batch)
+            except Exception as error:
+                print(f"{_ERR_TAG} {error}")
+                logger.debug("Chat batch processing failed", exc_info=True)
     
     async def event_error(self, error: Exception, data: str = None):
         """Called when an error occurs."""
-        print(f"{Fore.RED}[Error] {error}{Style.RESET_ALL}")
+        print(f"{_ERR_TAG} {error}")
         if data:
-            print(f"{Fore.RED}  Data: {data}{Style.RESET_ALL}")
+            print(f"{_ERR_TAG}   Data: {data}")
@@ -4,10 +4,20 @@ Configuration loader for arcade-coach.
 Loads settings from YAML config file with sensible defaults.
 """
 
+import copy
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 import yaml
 
+# libyaml's C loader parses 5-10x faster than the pure-Python one;
+# same safe_load semantics either way
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 DEFAULT_CONFIG = {
     "timers": {
@@ -35,29 +45,35 @@ DEFAULT_CONFIG = {
 }
 
 
-def load_config(config_path: Path) -> dict[str, Any]:
+def _merge(base: dict, override: dict):
+    """Recursively merge override values into base, in place."""
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _merge(base[key], value)
+        else:
+            base[key] = value
+
+
+def load_config(config_path: Path) -> Mapping[str, Any]:
     """
     Load configuration from YAML file.
-    
-    Missing keys are filled with defaults.
-    
+
+    Missing keys are filled with defaults, so every key in
+    DEFAULT_CONFIG is guaranteed present and consumers can index
+    directly without per-lookup fallbacks.
+
     Args:
         config_path: Path to config YAML file
-        
+
     Returns:
-        Configuration dictionary
+        Read-only configuration mapping
     """
-    config = DEFAULT_CONFIG.copy()
-    
+    config = copy.deepcopy(DEFAULT_CONFIG)
+
     if config_path.exists():
         with open(config_path, "r", encoding="utf-8") as f:
-            user_config = yaml.safe_load(f) or {}
-        
-        # Deep merge user config into defaults
-        for section, values in user_config.items():
-            if section in config and isinstance(config[section], dict):
-                config[section].update(values)
-            else:
-                config[section] = values
-    
-    return config
+            user_config = yaml.load(f, Loader=SafeLoader) or {}
+
+        _merge(config, user_config)
+
+    return MappingProxyType(config)
@@ -5,9 +5,39 @@ Tracks chat activity and hype levels to determine when it's
 a good moment to send reminders. Never interrupt a moment.
 """
 
-from datetime import datetime, timedelta
+import collections
+import itertools
+import logging
+import re
+import time
 from typing import Optional
-from colorama import Fore, Style
+
+# Optional accelerators for the hype keyword scan, fastest first:
+# hyperscan (SIMD-backed DFA), then pyahocorasick (C automaton), then
+# the pure-Python word-set/regex path.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
+
+# Monotonic clock for all context timing - cheaper than datetime.now()
+# and immune to wall-clock adjustments
+_now = time.monotonic
+
+# Rolling window for chat velocity (seconds)
+VELOCITY_WINDOW_SECONDS = 300
+
+# Hard cap on tracked message timestamps so a sustained chat flood
+# cannot grow memory unbounded. Velocity stays accurate past the cap
+# because it normalizes by the actual span of the buffer.
+MAX_TRACKED_MESSAGES = 4096
 
 
 class ContextEngine:
@@ -21,7 +51,26 @@ class ContextEngine:
     - Recent hype keywords
     - Chat velocity (messages per minute)
     """
-    
+
+    # No per-instance __dict__: attribute access on the per-message
+    # paths skips the dict lookup
+    __slots__ = (
+        "quiet_threshold",
+        "hype_cooldown",
+        "hype_keywords",
+        "wait_for_quiet",
+        "debug",
+        "_hype_db",
+        "_hype_automaton",
+        "_hype_pattern",
+        "_hype_words",
+        "_hyperscan_hit",
+        "_needs_content",
+        "last_message_time",
+        "last_hype_time",
+        "message_times",
+    )
+
     def __init__(self, config: dict):
         """
         Initialize the context engine.
@@ -29,48 +78,167 @@ class ContextEngine:
         Args:
             config: Configuration dictionary
         """
-        context_config = config.get("context", {})
-        
-        self.quiet_threshold = context_config.get("quiet_threshold_seconds", 30)
-        self.hype_cooldown = context_config.get("hype_cooldown_seconds", 60)
-        self.hype_keywords = [kw.lower() for kw in context_config.get("hype_keywords", [])]
-        self.wait_for_quiet = context_config.get("wait_for_quiet", True)
-        
-        self.debug = config.get("logging", {}).get("debug", False)
+        context_config = config["context"]
+
+        self.quiet_threshold = context_config["quiet_threshold_seconds"]
+        self.hype_cooldown = context_config["hype_cooldown_seconds"]
+        self.hype_keywords = [kw.lower() for kw in context_config["hype_keywords"]]
+        self.wait_for_quiet = context_config["wait_for_quiet"]
+
+        self.debug = config["logging"]["debug"]
+
+        # Compile the keyword list once so each message is scanned in a
+        # single pass instead of one substring search per keyword
+        self._hype_db = None
+        self._hype_automaton = None
+        self._hype_pattern = None
+        self._hype_words: frozenset[str] = frozenset()
+        self._hyperscan_hit: Optional[int] = None
+        if self.hype_keywords:
+            if hyperscan is not None:
+                expressions = [re.escape(kw).encode() for kw in self.hype_keywords]
+                db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+                db.compile(
+                    expressions=expressions,
+                    ids=list(range(len(expressions))),
+                    flags=[hyperscan.HS_FLAG_CASELESS] * len(expressions),
+                )
+                self._hype_db = db
+            elif ahocorasick is not None:
+                automaton = ahocorasick.Automaton()
+                for keyword in self.hype_keywords:
+                    automaton.add_word(keyword, keyword)
+                automaton.make_automaton()
+                self._hype_automaton = automaton
+            else:
+                # Single-word keywords hash-match against the tokenized
+                # message as a fast accept; the alternation regex over
+                # all keywords backstops it so punctuation-adjacent hits
+                # ("pog!!!") and multi-word phrases match just like the
+                # accelerated tiers
+                self._hype_words = frozenset(
+                    kw for kw in self.hype_keywords if " " not in kw
+                )
+                self._hype_pattern = re.compile(
+                    "|".join(map(re.escape, self.hype_keywords)),
+                    re.IGNORECASE,
+                )
         
-        # State tracking
-        self.last_message_time: datetime = datetime.now()
-        self.last_hype_time: Optional[datetime] = None
-        self.message_times: list[datetime] = []  # Rolling window for velocity
+        # Message content only needs inspecting when a feature that
+        # reads it is enabled; precomputed so batches can skip it cheaply
+        self._needs_content = bool(self.hype_keywords) or self.debug
+
+        # State tracking (monotonic seconds; 0.0 means no hype seen yet,
+        # which reads as long past the cooldown)
+        self.last_message_time: float = _now()
+        self.last_hype_time: float = 0.0
+        # Rolling window of monotonic timestamps for velocity
+        self.message_times: collections.deque[float] = collections.deque(
+            maxlen=MAX_TRACKED_MESSAGES
+        )
     
     def on_message(self, username: str, content: str, is_streamer: bool = False):
         """
         Process an incoming chat message for context.
-        
+
         Args:
             username: The username of the chatter
             content: The message content
             is_streamer: Whether this message is from the channel owner
         """
-        now = datetime.now()
+        self.on_message_batch(((username, content, is_streamer),))
+
+    def on_message_batch(self, messages):
+        """
+        Process a batch of chat messages in a single coalesced pass.
+
+        Activity state is updated once for the whole batch, so a chat
+        flood costs one clock read and one prune instead of one each
+        per message.
+
+        Args:
+            messages: Sequence of (username, content, is_streamer) tuples
+        """
+        if not messages:
+            return
+
+        now = _now()
         self.last_message_time = now
-        
+
         # Track message times for velocity calculation
-        self.message_times.append(now)
-        
-        # Prune old messages (keep last 5 minutes)
-        cutoff = now - timedelta(minutes=5)
-        self.message_times = [t for t in self.message_times if t > cutoff]
-        
-        # Check for hype keywords
-        content_lower = content.lower()
-        for keyword in self.hype_keywords:
-            if keyword in content_lower:
-                self.last_hype_time = now
-                if self.debug:
-                    print(f"{Fore.BLUE}[Debug] Hype detected: {keyword}{Style.RESET_ALL}")
-                break
-    
+        self.message_times.extend(itertools.repeat(now, len(messages)))
+
+        # Prune old messages from the left (keep last 5 minutes)
+        cutoff = now - VELOCITY_WINDOW_SECONDS
+        while self.message_times and self.message_times[0] <= cutoff:
+            self.message_times.popleft()
+
+        # Content inspection is skipped entirely unless a feature needs it
+        if not self._needs_content:
+            return
+
+        # Check for hype keywords (single-pass scan, first match wins)
+        if self.hype_keywords:
+            for _, content, _ in messages:
+                keyword = self._find_hype_keyword(content)
+                if keyword is not None:
+                    self.last_hype_time = now
+                    logger.debug("Hype detected: %s", keyword)
+                    break
+
+
+    def _find_hype_keyword(self, content: str) -> Optional[str]:
+        """
+        Scan a message for hype keywords.
+
+        Args:
+            content: The message content
+
+        Returns:
+            The first matching keyword, or None
+        """
+        if self._hype_db is not None:
+            self._hyperscan_hit = None
+            try:
+                self._hype_db.scan(
+                    content.encode(),
+                    match_event_handler=self._on_hyperscan_match,
+                )
+            except hyperscan.ScanTerminated:
+                # Expected on every hit: the callback returns non-zero
+                # to halt the scan at the first match
+                pass
+            if self._hyperscan_hit is not None:
+                return self.hype_keywords[self._hyperscan_hit]
+            return None
+
+        if self._hype_automaton is not None:
+            # pyahocorasick has no caseless mode, so lowercase here
+            for _, keyword in self._hype_automaton.iter(content.lower()):
+                return keyword
+            return None
+
+        if self._hype_words:
+            # Fast accept: set intersection of tokenized words runs in
+            # C; on a miss, fall through to the regex backstop
+            tokens = content.lower().split()
+            if not self._hype_words.isdisjoint(tokens):
+                for token in tokens:
+                    if token in self._hype_words:
+                        return token
+
+        if self._hype_pattern is not None:
+            match = self._hype_pattern.search(content)
+            if match:
+                return match.group()
+
+        return None
+
+    def _on_hyperscan_match(self, kw_id: int, start: int, end: int, flags: int, context) -> int:
+        """Hyperscan match callback; non-zero return halts at the first hit."""
+        self._hyperscan_hit = kw_id
+        return 1
+
     def is_good_moment(self) -> bool:
         """
         Check if this is a good moment to send a reminder.
@@ -80,25 +248,31 @@ class ContextEngine:
         """
         if not self.wait_for_quiet:
             return True
-        
-        now = datetime.now()
-        
-        # Check if chat is quiet
-        seconds_since_message = (now - self.last_message_time).total_seconds()
-        is_quiet = seconds_since_message >= self.quiet_threshold
-        
-        # Check if we're past hype cooldown
-        if self.last_hype_time is not None:
-            seconds_since_hype = (now - self.last_hype_time).total_seconds()
-            past_hype = seconds_since_hype >= self.hype_cooldown
-        else:
-            past_hype = True
-        
-        if self.debug:
-            print(f"{Fore.BLUE}[Debug] Context check: quiet={is_quiet}, past_hype={past_hype}{Style.RESET_ALL}")
-        
-        return is_quiet and past_hype
+
+        # Chat must be quiet and the hype cooldown elapsed
+        now = _now()
+        return (
+            now - self.last_message_time >= self.quiet_threshold
+            and now - self.last_hype_time >= self.hype_cooldown
+        )
     
+    def seconds_until_good_moment(self) -> float:
+        """
+        Estimate seconds until the next good moment, assuming chat stays quiet.
+
+        Returns:
+            Seconds to wait, or 0.0 if it's a good moment right now
+        """
+        if not self.wait_for_quiet:
+            return 0.0
+
+        now = _now()
+        wait = max(
+            self.quiet_threshold - (now - self.last_message_time),
+            self.hype_cooldown - (now - self.last_hype_time),
+        )
+        return wait if wait > 0 else 0.0
+
     def get_messages_per_minute(self) -> float:
         """
         Calculate current chat velocity.
@@ -106,23 +280,23 @@ class ContextEngine:
         Returns:
             Messages per minute over the last 5 minutes
         """
+        now = _now()
+
+        # Prune old messages so stale entries don't inflate the count
+        cutoff = now - VELOCITY_WINDOW_SECONDS
+        while self.message_times and self.message_times[0] <= cutoff:
+            self.message_times.popleft()
+
         if not self.message_times:
             return 0.0
-        
-        now = datetime.now()
-        cutoff = now - timedelta(minutes=5)
-        recent = [t for t in self.message_times if t > cutoff]
-        
-        if not recent:
-            return 0.0
-        
+
         # Calculate time span
-        time_span = (now - recent[0]).total_seconds() / 60
+        time_span = (now - self.message_times[0]) / 60
         if time_span < 0.1:
             return 0.0
-        
-        return len(recent) / time_span
+
+        return len(self.message_times) / time_span
     
     def seconds_since_last_message(self) -> float:
         """Get seconds since the last chat message."""
-        return (datetime.now() - self.last_message_time).total_seconds()
+        return _now() - self.last_message_time
@@ -6,51 +6,65 @@ based on context awareness.
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import logging
+import time
+from datetime import timedelta
 from typing import Optional
 from colorama import Fore, Style
 
 from coach.notifier import Notifier
 from coach.context import ContextEngine
 
+logger = logging.getLogger(__name__)
+
+# Pre-rendered console tags - the ANSI wrapping never changes, so
+# building it per print is wasted work
+_COACH_TAG = f"{Fore.CYAN}[Coach]{Style.RESET_ALL}"
+_REMINDER_TAG = f"{Fore.GREEN}[Coach]{Style.RESET_ALL}"
+
+# Monotonic clock for all timer bookkeeping - cheaper than datetime.now()
+# and immune to wall-clock adjustments
+_now = time.monotonic
+
 
 class Timer:
     """Represents a single self-care timer."""
-    
+
+    # No per-instance __dict__: shrinks each timer and speeds up the
+    # attribute access in the monitoring loop
+    __slots__ = (
+        "name",
+        "interval_seconds",
+        "message",
+        "last_triggered",
+        "started_at",
+        "pending",
+    )
+
     def __init__(self, name: str, interval_minutes: int, message: str):
         self.name = name
-        self.interval = timedelta(minutes=interval_minutes)
+        self.interval_seconds = interval_minutes * 60.0
         self.message = message
-        self.last_triggered: Optional[datetime] = None
-        self.started_at: datetime = datetime.now()
+        self.last_triggered: Optional[float] = None
+        self.started_at: float = _now()
         self.pending: bool = False  # True if due but waiting for good moment
-    
+
     def is_due(self) -> bool:
         """Check if this timer is due to fire."""
-        now = datetime.now()
-        
-        if self.last_triggered is None:
-            # First trigger: based on start time
-            return (now - self.started_at) >= self.interval
-        else:
-            return (now - self.last_triggered) >= self.interval
-    
+        # First trigger is based on start time
+        anchor = self.last_triggered if self.last_triggered is not None else self.started_at
+        return (_now() - anchor) >= self.interval_seconds
+
     def trigger(self):
         """Mark timer as triggered."""
-        self.last_triggered = datetime.now()
+        self.last_triggered = _now()
         self.pending = False
-    
-    def time_until_due(self) -> timedelta:
-        """Get time remaining until timer is due."""
-        now = datetime.now()
-        
-        if self.last_triggered is None:
-            next_due = self.started_at + self.interval
-        else:
-            next_due = self.last_triggered + self.interval
-        
-        remaining = next_due - now
-        return remaining if remaining.total_seconds() > 0 else timedelta(0)
+
+    def time_until_due(self) -> float:
+        """Get seconds remaining until timer is due."""
+        anchor = self.last_triggered if self.last_triggered is not None else self.started_at
+        remaining = (anchor + self.interval_seconds) - _now()
+        return remaining if remaining > 0 else 0.0
 
 
 class CoachEngine:
@@ -82,17 +96,16 @@ class CoachEngine:
         self.notifier = notifier
         self.context = context
         
-        self.debug = config.get("logging", {}).get("debug", False)
-        self.show_timers = config.get("logging", {}).get("show_timers", True)
-        
+        self.show_timers = config["logging"]["show_timers"]
+
         # Load timer settings
-        timer_config = config.get("timers", {})
+        timer_config = config["timers"]
         
         # Initialize timers
         self.timers: list[Timer] = []
         
         # Break reminder
-        break_mins = timer_config.get("break_reminder_minutes", 120)
+        break_mins = timer_config["break_reminder_minutes"]
         if break_mins > 0:
             self.timers.append(Timer(
                 name="break",
@@ -101,7 +114,7 @@ class CoachEngine:
             ))
         
         # Hydration reminder
-        hydration_mins = timer_config.get("hydration_reminder_minutes", 45)
+        hydration_mins = timer_config["hydration_reminder_minutes"]
         if hydration_mins > 0:
             self.timers.append(Timer(
                 name="hydration",
@@ -110,7 +123,7 @@ class CoachEngine:
             ))
         
         # Posture reminder
-        posture_mins = timer_config.get("posture_reminder_minutes", 90)
+        posture_mins = timer_config["posture_reminder_minutes"]
         if posture_mins > 0:
             self.timers.append(Timer(
                 name="posture",
@@ -119,7 +132,7 @@ class CoachEngine:
             ))
         
         # Stream duration alert
-        duration_mins = timer_config.get("stream_duration_alert_minutes", 240)
+        duration_mins = timer_config["stream_duration_alert_minutes"]
         if duration_mins > 0:
             self.timers.append(Timer(
                 name="duration",
@@ -127,20 +140,30 @@ class CoachEngine:
                 message="You've been streaming for a while. Consider wrapping up soon."
             ))
         
-        # Stream start time
-        self.stream_start = datetime.now()
+        # Name lookup for reset_timer; the list keeps display order
+        self._timers_by_name = {t.name: t for t in self.timers}
+
+        # Stream start time (monotonic seconds)
+        self.stream_start: float = _now()
         
         # Monitoring task handle
         self._monitoring_task: Optional[asyncio.Task] = None
+
+        # Set to wake the monitoring loop early (e.g. after a timer reset)
+        self._wakeup = asyncio.Event()
+
+        # Cached schedule from the last timer scan, so wakeups with
+        # nothing due can skip the scan entirely
+        self._next_deadline: float = 0.0
+        self._any_pending: bool = False
     
     async def start_monitoring(self):
         """
         Start the background timer monitoring loop.
         """
         self._monitoring_task = asyncio.current_task()
-        
-        if self.debug:
-            print(f"{Fore.BLUE}[Debug] Starting timer monitoring{Style.RESET_ALL}")
+
+        logger.debug("Starting timer monitoring")
         
         # Show initial timer status
         if self.show_timers:
@@ -148,11 +171,20 @@ class CoachEngine:
         
         try:
             while True:
-                await self._check_timers()
-                await asyncio.sleep(10)  # Check every 10 seconds
+                if self._any_pending or _now() >= self._next_deadline:
+                    next_check = await self._check_timers()
+                else:
+                    # Woken early with nothing due - go back to sleep
+                    next_check = self._next_deadline - _now()
+                # Sleep until the next timer needs attention, but wake
+                # early if something (e.g. a reset) changes the schedule
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=next_check)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
         except asyncio.CancelledError:
-            if self.debug:
-                print(f"{Fore.BLUE}[Debug] Timer monitoring stopped{Style.RESET_ALL}")
+            logger.debug("Timer monitoring stopped")
             raise
     
     async def stop_monitoring(self):
@@ -168,17 +200,42 @@ class CoachEngine:
         
         self._monitoring_task = None
     
-    async def _check_timers(self):
-        """Check all timers and send notifications when appropriate."""
+    async def _check_timers(self) -> float:
+        """
+        Check all timers and send notifications when appropriate.
+
+        Returns:
+            Seconds until the next timer needs attention, used by the
+            monitoring loop as its sleep timeout
+        """
         for timer in self.timers:
             if timer.is_due() or timer.pending:
                 timer.pending = True
-                
+
                 # Check if it's a good moment
                 if self.context.is_good_moment():
                     self._trigger_timer(timer)
-                elif self.debug:
-                    print(f"{Fore.BLUE}[Debug] {timer.name} pending, waiting for good moment{Style.RESET_ALL}")
+                else:
+                    logger.debug("%s pending, waiting for good moment", timer.name)
+
+        # Next wakeup: when the nearest timer comes due, or - if a timer
+        # is pending - when the current quiet window could open
+        next_check = min(
+            (t.time_until_due() for t in self.timers if not t.pending),
+            default=60.0,
+        )
+        any_pending = any(t.pending for t in self.timers)
+        if any_pending:
+            next_check = min(next_check, self.context.seconds_until_good_moment())
+
+        # Clamp so the loop can never spin hot
+        next_check = max(next_check, 1.0)
+
+        # Cache the schedule for the skip check in the monitoring loop
+        self._any_pending = any_pending
+        self._next_deadline = _now() + next_check
+
+        return next_check
     
     def _trigger_timer(self, timer: Timer):
         """
@@ -188,7 +245,7 @@ class CoachEngine:
             timer: The timer to trigger
         """
         if self.show_timers:
-            print(f"{Fore.GREEN}[Coach]{Style.RESET_ALL} → {timer.name.capitalize()} reminder")
+            print(f"{_REMINDER_TAG} → {timer.name.capitalize()} reminder")
         
         # Send notification
         self.notifier.notify_reminder(
@@ -200,16 +257,15 @@ class CoachEngine:
     
     def _print_timer_status(self):
         """Print current timer status to console."""
-        print(f"{Fore.CYAN}[Coach]{Style.RESET_ALL} Active timers:")
+        print(f"{_COACH_TAG} Active timers:")
         for timer in self.timers:
-            remaining = timer.time_until_due()
-            mins = int(remaining.total_seconds() / 60)
+            mins = int(timer.time_until_due() / 60)
             print(f"  - {timer.name.capitalize()}: {mins} min remaining")
         print()
     
     def get_stream_duration(self) -> timedelta:
         """Get how long the stream has been running."""
-        return datetime.now() - self.stream_start
+        return timedelta(seconds=_now() - self.stream_start)
     
     def reset_timer(self, timer_name: str):
         """
@@ -218,10 +274,12 @@ class CoachEngine:
         Args:
             timer_name: Name of timer to reset
         """
-        for timer in self.timers:
-            if timer.name == timer_name:
-                timer.last_triggered = datetime.now()
-                timer.pending = False
-                if self.show_timers:
-                    print(f"{Fore.CYAN}[Coach]{Style.RESET_ALL} Reset {timer_name} timer")
-                break
+        timer = self._timers_by_name.get(timer_name)
+        if timer is None:
+            return
+
+        timer.last_triggered = _now()
+        timer.pending = False
+        self._wakeup.set()  # Let the monitoring loop pick up the new schedule
+        if self.show_timers:
+            print(f"{_COACH_TAG} Reset {timer_name} timer")
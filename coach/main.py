@@ -6,6 +6,7 @@ Run with: python -m coach
 """
 
 import asyncio
+import logging
 import os
 import sys
 from pathlib import Path
@@ -19,6 +20,11 @@ from coach.engine import CoachEngine
 from coach.notifier import Notifier
 from coach.context import ContextEngine
 
+# Pre-rendered console tags - the ANSI wrapping never changes, so
+# building it per print is wasted work
+_COACH_TAG = f"{Fore.CYAN}[Coach]{Style.RESET_ALL}"
+_ERR_TAG = f"{Fore.RED}[Error]{Style.RESET_ALL}"
+
 
 def print_banner():
     """Display startup banner."""
@@ -37,7 +43,7 @@ def validate_environment():
     missing = [var for var in required if not os.getenv(var)]
     
     if missing:
-        print(f"{Fore.RED}[Error] Missing required environment variables:{Style.RESET_ALL}")
+        print(f"{_ERR_TAG} Missing required environment variables:")
         for var in missing:
             print(f"  - {var}")
         print()
@@ -47,8 +53,21 @@ def validate_environment():
 
 def main():
     """Main entry point."""
+    # Line-buffer stdout so batched chat log writes flush promptly.
+    # Done before colorama wraps the stream, which may not support
+    # reconfigure()
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=True)
+
     # Initialize colorama for Windows
     colorama_init()
+
+    # Use uvloop's faster event loop where available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     
     # Show banner
     print_banner()
@@ -69,8 +88,16 @@ def main():
     if not config_path.exists():
         config_path = Path(__file__).parent.parent / "config.example.yaml"
     
-    print(f"{Fore.CYAN}[Coach]{Style.RESET_ALL} Loading configuration...")
+    print(f"{_COACH_TAG} Loading configuration...")
     config = load_config(config_path)
+
+    # Debug logging goes through the logging module so disabled-level
+    # messages cost nothing on the hot paths
+    debug = config["logging"]["debug"]
+    logging.basicConfig(
+        level=logging.DEBUG if debug else logging.WARNING,
+        format="[%(levelname)s] %(name)s: %(message)s",
+    )
     
     # Initialize notifier
     notifier = Notifier(config)
@@ -91,7 +118,7 @@ def main():
         token = token[6:]
     
     # Initialize and run the bot
-    print(f"{Fore.CYAN}[Coach]{Style.RESET_ALL} Connecting to #{channel}...")
+    print(f"{_COACH_TAG} Connecting to #{channel}...")
     print()
     
     bot = CoachBot(
@@ -111,8 +138,8 @@ def main():
     
     # Graceful shutdown
     print()
-    print(f"{Fore.CYAN}[Coach]{Style.RESET_ALL} Shutting down...")
-    print(f"{Fore.CYAN}[Coach]{Style.RESET_ALL} Take care of yourself!")
+    print(f"{_COACH_TAG} Shutting down...")
+    print(f"{_COACH_TAG} Take care of yourself!")
 
 
 if __name__ == "__main__":
@@ -29,7 +29,16 @@ class Notifier:
     """
     Handles sending native notifications across platforms.
     """
-    
+
+    # Notification titles by reminder type
+    _TITLES = {
+        "break": "Break Time",
+        "hydration": "Hydration Check",
+        "posture": "Posture Check",
+        "duration": "Stream Duration",
+    }
+
+
     def __init__(self, config: dict):
         """
         Initialize the notifier.
@@ -37,19 +46,20 @@ class Notifier:
         Args:
             config: Configuration dictionary
         """
-        notif_config = config.get("notifications", {})
-        
-        self.app_name = notif_config.get("app_name", "Coach")
-        self.sound_enabled = notif_config.get("sound", True)
-        self.duration = notif_config.get("duration", "long")
+        notif_config = config["notifications"]
+
+        self.app_name = notif_config["app_name"]
+        self.sound_enabled = notif_config["sound"]
+        self.duration = notif_config["duration"]
         self.timeout_seconds = 10 if self.duration == "long" else 5
         
         if BACKEND is None:
             from colorama import Fore, Style
+            warn_tag = f"{Fore.YELLOW}[Coach]{Style.RESET_ALL}"
             if PLATFORM == "win32":
-                print(f"{Fore.YELLOW}[Coach]{Style.RESET_ALL} winotify not installed, notifications disabled")
+                print(f"{warn_tag} winotify not installed, notifications disabled")
             else:
-                print(f"{Fore.YELLOW}[Coach]{Style.RESET_ALL} plyer not installed, notifications disabled")
+                print(f"{warn_tag} plyer not installed, notifications disabled")
     
     def _send(self, title: str, message: str):
         """Send a notification using the platform-appropriate backend."""
@@ -95,14 +105,7 @@ class Notifier:
             reminder_type: Type of reminder (break, hydration, posture, duration)
             message: The reminder message
         """
-        titles = {
-            "break": "Break Time",
-            "hydration": "Hydration Check",
-            "posture": "Posture Check",
-            "duration": "Stream Duration",
-        }
-        
-        title = titles.get(reminder_type, "Reminder")
+        title = self._TITLES.get(reminder_type, "Reminder")
         self._send(title, message)
     
     def notify_custom(self, title: str, message: str):